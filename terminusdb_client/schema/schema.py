@@ -13,6 +13,9 @@ from .. import woql_type as wt
 from ..client import Client, GraphType
 from ..woql_type import to_woql_type
 
+# sentinel for class flags that can be set to falsy values (e.g. _subdocument = [])
+_MISSING = object()
+
 
 class TerminusKey:
     def __init__(self, keys: Union[str, list, None] = None):
@@ -51,14 +54,28 @@ class RandomKey(TerminusKey):
 
 def _check_cycling(class_obj: "TerminusClass"):
     """Helper function to check if the embedded subdocument is cycling"""
-    if hasattr(class_obj, "_subdocument"):
+    if getattr(class_obj, "_subdocument", _MISSING) is not _MISSING:
         mro_names = [obj.__name__ for obj in class_obj.__mro__]
         for prop_type in class_obj._annotations.values():
             if str(prop_type) in mro_names:
                 raise RecursionError(f"Embbding {prop_type} cause recursions.")
 
 
-def _check_mismatch_type(prop, prop_value, prop_type):
+def _simple_type_of(prop_type):
+    """Helper function to get the type(s) that values of a datatype property can be checked against with isinstance. Return None if typeguard is needed for the checking."""
+    if prop_type is float:
+        # int is acceptable for float, same as typeguard
+        return (int, float)
+    elif isinstance(prop_type, type) and prop_type in wt.CONVERT_TYPE:
+        return prop_type
+    elif getattr(prop_type, "__origin__", None) is Union:
+        args = [arg for arg in prop_type.__args__ if arg is not type(None)]
+        if len(args) == 1:  # it's Optional
+            return _simple_type_of(args[0])
+    return None
+
+
+def _check_mismatch_type(prop, prop_value, prop_type, simple_type=None):
     if hasattr(prop_type, "_to_dict"):
         prop_value_id = prop_value.__class__._to_dict().get("@id")
         prop_type_id = prop_type._to_dict().get("@id")
@@ -67,7 +84,8 @@ def _check_mismatch_type(prop, prop_value, prop_type):
                 f"Property {prop} should be of type {prop_type_id} but got value of type {prop_value_id}"
             )
     else:
-        check_type(prop, prop_value, prop_type)
+        if simple_type is None or not isinstance(prop_value, simple_type):
+            check_type(prop, prop_value, prop_type)
 
 
 def _check_missing_prop(doc_obj: "DocumentTemplate"):
@@ -83,17 +101,59 @@ def _check_missing_prop(doc_obj: "DocumentTemplate"):
                 if not hasattr(doc_obj, prop):
                     raise ValueError(f"{doc_obj} missing property: {prop}")
                 else:
-                    prop_value = eval(f"doc_obj.{prop}")  # noqa: S307
-                    _check_mismatch_type(prop, prop_value, prop_type)
+                    prop_value = getattr(doc_obj, prop)
+                    _check_mismatch_type(
+                        prop,
+                        prop_value,
+                        prop_type,
+                        class_obj._simple_types.get(prop),
+                    )
                     # raise TypeError(f"Property of {doc_obj} missing should be type {prop_type} but got {prop_value} which is {type(prop_value)}")
 
 
+def _get_embedded_rep(obj: "DocumentTemplate", references: dict):
+    """Helper function to get the representation of an object property, references that need to be captured are collected into references"""
+    ref_obj = obj._embedded_rep()
+    if "@ref" in ref_obj:
+        references[ref_obj["@ref"]] = obj
+    elif "@id" not in ref_obj:
+        (ref_obj, refs) = ref_obj
+        references.update(refs)
+    return ref_obj
+
+
+def _get_sub_item_rep(sub_item, references: dict):
+    """Helper function to get the representation of an item in a list or set property"""
+    # inner is object properties
+    if isinstance(sub_item, DocumentTemplate):
+        return _get_embedded_rep(sub_item, references)
+    # inner is Enum
+    elif isinstance(sub_item, Enum):
+        return str(sub_item)
+    # inner is datatypes
+    return sub_item
+
+
 def _check_and_fix_custom_id(class_name, custom_id):
     if custom_id[: len(class_name) + 1] != (class_name + "/"):
         custom_id = class_name + "/" + custom_id
     return urlparse.quote(custom_id)
 
 
+def _parse_class_doc(cls: "TerminusClass"):
+    """Helper function to get the comment and the (property, description) pairs from the class docstring, parsed with numpydoc once per class"""
+    if "_class_doc" not in cls.__dict__:
+        doc_obj = ClassDoc(cls)
+        prop_doc = tuple(
+            (thing.name, "\n".join(thing.desc))
+            for thing in doc_obj["Attributes"]
+            if thing.desc
+        )
+        comment = "\n".join(doc_obj["Summary"] + doc_obj["Extended Summary"])
+        cls._class_doc = (comment, prop_doc)
+    return cls._class_doc
+
+
 class TerminusClass(type):
     def __init__(cls, name, bases, nmspc):
 
@@ -105,10 +165,14 @@ class TerminusClass(type):
             cls._annotations = {}
 
         for parent in bases:
-            base_annotations = (
-                parent._annotations if hasattr(parent, "_annotations") else {}
-            )
-            cls._annotations.update(base_annotations)
+            cls._annotations.update(getattr(parent, "_annotations", {}))
+
+        # properties that can only hold datatypes: {prop: types for isinstance}
+        cls._simple_types = {}
+        for prop, prop_type in cls._annotations.items():
+            simple_type = _simple_type_of(prop_type)
+            if simple_type is not None:
+                cls._simple_types[prop] = simple_type
 
         abstract = False
         if "_abstract" in nmspc:
@@ -153,7 +217,6 @@ class TerminusClass(type):
             if kwargs.get("_backend_id"):
                 obj._backend_id = kwargs.get("_backend_id")
             obj._isinstance = True
-            obj._annotations = cls._annotations
             obj._instances.add(weakref.ref(obj))
 
             obj._capture = f"{name}{id(cls)}/{cls._capture_order}"
@@ -162,8 +225,6 @@ class TerminusClass(type):
         cls.__init__ = init
 
         if cls._schema is not None:
-            if not hasattr(cls._schema, "object"):
-                cls._schema.object = {}
             cls._schema.add_obj(name, cls)
 
         # super().__init__(name, bases, nmspc)
@@ -195,13 +256,13 @@ class DocumentTemplate(metaclass=TerminusClass):
                     value = int(value)
                 except ValueError:
                     raise TypeError(f"Unable to cast as int: {value}")
-            _check_mismatch_type(name, value, correct_type)
-        if (
-            self._id
-            and hasattr(self, "_key")
-            and hasattr(self._key, "_keys")
-            and name in self._key._keys
-        ):
+            _check_mismatch_type(
+                name,
+                value,
+                correct_type,
+                self._simple_types.get(name),
+            )
+        if name in getattr(self._key, "_keys", ()) and self._id:
             raise ValueError(
                 f"{name} has been used to generated id hance cannot be changed."
             )
@@ -220,42 +281,48 @@ class DocumentTemplate(metaclass=TerminusClass):
             result["@inherits"] = parents[1 : parents.index("DocumentTemplate")]
 
         if cls.__doc__:
-            doc_obj = ClassDoc(cls)
-            prop_doc = {}
-            for thing in doc_obj["Attributes"]:
-                if thing.desc:
-                    prop_doc[thing.name] = "\n".join(thing.desc)
+            (comment, prop_doc) = _parse_class_doc(cls)
             result["@documentation"] = {
-                "@comment": "\n".join(doc_obj["Summary"] + doc_obj["Extended Summary"]),
-                "@properties": prop_doc,
+                "@comment": comment,
+                "@properties": dict(prop_doc),
             }
 
-        if hasattr(cls, "_base"):
-            result["@base"] = cls._base
-        if hasattr(cls, "_subdocument"):
-            result["@subdocument"] = cls._subdocument
+        base = getattr(cls, "_base", _MISSING)
+        if base is not _MISSING:
+            result["@base"] = base
+        subdocument = getattr(cls, "_subdocument", _MISSING)
+        if subdocument is not _MISSING:
+            result["@subdocument"] = subdocument
             result["@key"] = {"@type": "Random"}
-        if hasattr(cls, "_abstract") and cls._abstract is not None:
+        if getattr(cls, "_abstract", None) is not None:
             result["@abstract"] = cls._abstract
-        if hasattr(cls, "_key") and not hasattr(cls, "_subdocument"):
-            if hasattr(cls._key, "_keys"):
+        key = getattr(cls, "_key", _MISSING)
+        if key is not _MISSING and subdocument is _MISSING:
+            keys = getattr(key, "_keys", _MISSING)
+            if keys is not _MISSING:
                 result["@key"] = {
-                    "@type": cls._key.__class__.at_type,
-                    "@fields": cls._key._keys,
+                    "@type": key.__class__.at_type,
+                    "@fields": keys,
                 }
             else:
-                result["@key"] = {"@type": cls._key.__class__.at_type}
-        if hasattr(cls, "_annotations"):
-            for attr, attr_type in cls._annotations.items():
-                result[attr] = wt.to_woql_type(attr_type)
+                result["@key"] = {"@type": key.__class__.at_type}
+        if "_woql_annotations" not in cls.__dict__:
+            # resolved once per class, copied so callers cannot change it
+            cls._woql_annotations = {
+                attr: wt.to_woql_type(attr_type)
+                for attr, attr_type in cls._annotations.items()
+            }
+        result.update(deepcopy(cls._woql_annotations))
         return result
 
     @property
     def _id(self):
-        if hasattr(self, "_backend_id") and self._backend_id:
-            return self._backend_id
-        if hasattr(self, "_custom_id") and self._custom_id:
-            return _check_and_fix_custom_id(str(self.__class__), self._custom_id)
+        backend_id = getattr(self, "_backend_id", None)
+        if backend_id:
+            return backend_id
+        custom_id = getattr(self, "_custom_id", None)
+        if custom_id:
+            return _check_and_fix_custom_id(str(self.__class__), custom_id)
         else:
             return None
 
@@ -270,10 +337,11 @@ class DocumentTemplate(metaclass=TerminusClass):
 
     def _embedded_rep(self):
         """get representation for embedding as object property"""
-        if hasattr(self.__class__, "_subdocument"):
+        if getattr(self.__class__, "_subdocument", _MISSING) is not _MISSING:
             return self._obj_to_dict()
-        elif hasattr(self, "_id") and self._id:
-            return {"@id": self._id, "@type": "@id"}
+        obj_id = self._id
+        if obj_id:
+            return {"@id": obj_id, "@type": "@id"}
         else:
             return {"@ref": self._capture}
 
@@ -281,57 +349,37 @@ class DocumentTemplate(metaclass=TerminusClass):
         if not skip_checking:
             _check_missing_prop(self)
         result = {"@type": str(self.__class__)}
-        if hasattr(self, "_id") and self._id:
-            result["@id"] = self._id
-        elif not hasattr(self, "_subdocument"):
+        obj_id = self._id
+        if obj_id:
+            result["@id"] = obj_id
+        elif getattr(self, "_subdocument", _MISSING) is _MISSING:
             result["@capture"] = self._capture
 
         references = {}
-        for item in self._annotations.keys():
-            if hasattr(self, item):
-                the_item = eval(f"self.{item}")  # noqa: S307
-                if the_item is not None:
-                    # object properties
-                    if hasattr(the_item, "_embedded_rep"):
-                        ref_obj = the_item._embedded_rep()
-                        if '@ref' in ref_obj:
-                            references[ref_obj['@ref']] = the_item
-                        elif '@id' in ref_obj:
-                            pass
-                        else:
-                            (sub_item, refs) = ref_obj
-                            references = {**references, **refs}
-                            ref_obj = sub_item
-                        result[item] = ref_obj
-                    # handle list and set (set end up passing as list for jsonlize)
-                    elif isinstance(the_item, (list, set)):
-                        new_item = []
-                        for sub_item in the_item:
-                            # inner is object properties
-                            if hasattr(sub_item, "_embedded_rep"):
-                                ref_obj = sub_item._embedded_rep()
-                                if '@ref' in ref_obj:
-                                    references[ref_obj['@ref']] = sub_item
-                                elif '@id' in ref_obj:
-                                    pass
-                                else:
-                                    (sub_item, refs) = ref_obj
-                                    references = {**references, **refs}
-                                    ref_obj = sub_item
-                                new_item.append(ref_obj)
-                            # inner is Enum
-                            elif isinstance(sub_item, Enum):
-                                new_item.append(str(sub_item))
-                            # inner is datatypes
-                            else:
-                                new_item.append(sub_item)
-                        result[item] = new_item
-                    # Enum and datatypes
+        annotations = self._annotations
+        simple_types = self._simple_types
+        # all properties are set in __dict__ on init
+        for item, the_item in self.__dict__.items():
+            if item in annotations and the_item is not None:
+                # datatypes (values are checked on setattr), except mixin Enums
+                # such as (str, Enum) which also pass the check
+                if item in simple_types and not isinstance(the_item, Enum):
+                    result[item] = wt.datetime_to_woql(the_item)
+                # object properties
+                elif isinstance(the_item, DocumentTemplate):
+                    result[item] = _get_embedded_rep(the_item, references)
+                # handle list and set (set end up passing as list for jsonlize)
+                elif isinstance(the_item, (list, set)):
+                    result[item] = [
+                        _get_sub_item_rep(sub_item, references)
+                        for sub_item in the_item
+                    ]
+                # Enum and datatypes
+                else:
+                    if isinstance(the_item, Enum):
+                        result[item] = str(the_item)
                     else:
-                        if isinstance(the_item, Enum):
-                            result[item] = str(the_item)
-                        else:
-                            result[item] = wt.datetime_to_woql(the_item)
+                        result[item] = wt.datetime_to_woql(the_item)
         return (result, references)
 
 
@@ -351,9 +399,7 @@ class EnumMetaTemplate(EnumMeta):
             classdict._member_names.remove("_schema")
             new_cls = super().__new__(metacls, cls, bases, classdict)
             new_cls._schema = schema
-            if not hasattr(schema, "object"):
-                schema.object = {}
-            schema.object[cls] = new_cls
+            schema.add_obj(cls, new_cls)
         else:
             new_cls = super().__new__(metacls, cls, bases, classdict)
         globals()[cls] = new_cls
@@ -375,7 +421,7 @@ class EnumTemplate(Enum, metaclass=EnumMetaTemplate):
         result = {"@type": "Enum", "@id": cls.__name__, "@value": []}
         for item in cls.__members__:
             if item[0] != "_":
-                result["@value"].append(str(eval(f"cls.{item}")))  # noqa: S307
+                result["@value"].append(str(getattr(cls, item)))
         # if hasattr(self, "__annotations__"):
         #     for attr, attr_type in self.__annotations__.items():
         #         result[attr] = str(attr_type)
@@ -595,7 +641,7 @@ class Schema:
                 if not value_class:
                     raise ValueError(f"{obj_type} is not in current schema.")
                 if isinstance(value, dict):
-                    if hasattr(value_class, "_subdocument"):
+                    if getattr(value_class, "_subdocument", _MISSING) is not _MISSING:
                         # it's a subdocument
                         return self._construct_object(value)
                     else:
@@ -609,7 +655,7 @@ class Schema:
                     for key, item in value_class.__members__.items():
                         if item._value_ == value:
                             the_key = key
-                    return eval(f"value_class.{the_key}")  # noqa: S307
+                    return getattr(value_class, the_key)
             else:
                 raise ValueError(f"Schema {type_dict} is not correct.")
 
@@ -708,7 +754,7 @@ class Schema:
         """Import a list of documents in json format to Python objects. The schema of those documents need to be in this schema."""
         if isinstance(obj_dict, dict):
             return self._construct_object(obj_dict)
-        return list(map(self._construct_object, obj_dict))
+        return [self._construct_object(obj) for obj in obj_dict]
 
     def from_json_schema(
         self,
@@ -828,7 +874,7 @@ class Schema:
 
     def to_dict(self):
         """Return the schema in the TerminusDB dictionary format"""
-        all_obj = [cls._to_dict() for cls in self.all_obj()]
+        all_obj = [cls._to_dict() for cls in self.object.values()]
         all_obj.sort(key=lambda item: item.get("@id"))
         return [self.context] + all_obj
 
@@ -930,6 +976,16 @@ class Schema:
         return json_schema
 
     def copy(self):
-        return deepcopy(self)
+        """Return a copy of the schema. The class objects are shared with the original schema, only the containers holding them are copied."""
+        new_schema = Schema(
+            title=self.title,
+            description=self.description,
+            authors=copy(self.authors),
+            schema_ref=self.schema_ref,
+            base_ref=self.base_ref,
+        )
+        new_schema.object = copy(self.object)
+        new_schema._all_existing_classes = copy(self._all_existing_classes)
+        return new_schema
 
 WOQLSchema = Schema # noqa
@@ -214,7 +214,7 @@ def _create_script(obj_list):
             print_script += "Authors: " + ", ".join(documentation["@authors"]) + "\n"
         print_script += '"""\n'
     for obj_str in dir(woqlschema):
-        obj = eval(f"woqlschema.{obj_str}")  # noqa: S307
+        obj = getattr(woqlschema, obj_str)
         if (
             isinstance(obj, woqlschema.TerminusClass)
             or isinstance(obj, enum.EnumMeta)
@@ -352,7 +352,7 @@ def commit(message):
         authors=authors,
     )
     for obj_str in dir(schema_plan):
-        obj = eval(f"schema_plan.{obj_str}")  # noqa: S307
+        obj = getattr(schema_plan, obj_str)
         if isinstance(obj, woqlschema.TerminusClass) or isinstance(obj, enum.EnumMeta):
             if obj_str not in ["DocumentTemplate", "EnumTemplate", "TaggedUnion"]:
                 schema_obj.add_obj(obj.__name__, obj)
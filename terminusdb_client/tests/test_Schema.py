@@ -1,6 +1,8 @@
 import datetime as dt
+import sys
 import unittest.mock as mock
-from typing import Set
+from enum import Enum
+from typing import Any, Optional, Set
 from unittest.mock import ANY
 
 import pytest
@@ -40,6 +42,8 @@ class TypeCheck(DocumentTemplate):
     _schema = Schema()
     name: str
     age: int
+    height: float
+    nickname: Optional[str]
 
 
 class CheckCyclingGrandPa(DocumentTemplate):
@@ -93,6 +97,9 @@ def test_schema_copy(test_schema):
     my_schema = test_schema
     copy_schema = my_schema.copy()
     assert copy_schema.all_obj() == my_schema.all_obj()
+    copy_schema.add_enum_class("CopyOnly", ["item"])
+    assert "CopyOnly" in copy_schema.object
+    assert "CopyOnly" not in my_schema.object
     # assert copy_schema.all_prop() == {AddressOf, Title, PostCode}
 
 
@@ -110,12 +117,46 @@ def test_abstract_class_child():
     assert "@abstract" not in ChildAbs._to_dict()
 
 
+def test_to_dict_follows_class():
+    class DictCheck(DocumentTemplate):
+        """For checking the dictionary format"""
+
+        name: str
+        tags: Set[str]
+
+    class DictCheckChild(DictCheck):
+        age: int
+
+    DictCheck._to_dict()["tags"]["@class"] = "changed"
+    assert DictCheck._to_dict()["tags"]["@class"] == "xsd:string"
+    assert "@subdocument" not in DictCheckChild._to_dict()
+    DictCheck._subdocument = []
+    assert DictCheck._to_dict()["@subdocument"] == []
+    assert DictCheckChild._to_dict()["@subdocument"] == []
+    del DictCheck._subdocument
+    assert "@subdocument" not in DictCheck._to_dict()
+
+
+def test_any_property():
+    class AnyCheck(DocumentTemplate):
+        anything: Any
+
+    test_obj = AnyCheck(anything=1)
+    assert test_obj.anything == 1
+
+
 def test_type_check():
     test_obj = TypeCheck()
     with pytest.raises(TypeError):
         test_obj.name = 123
     with pytest.raises(TypeError):
         test_obj.age = "not a number"
+    test_obj.height = 180
+    with pytest.raises(TypeError):
+        test_obj.height = "tall"
+    test_obj.nickname = "Tom"
+    with pytest.raises(TypeError):
+        test_obj.nickname = 123
 
 
 def test_inheritance(test_schema):
@@ -127,6 +168,19 @@ def test_inheritance(test_schema):
             raise AssertionError(f"{item} not inherted")
 
 
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="Annotated requires Python 3.9")
+def test_type_check_unhashable_annotation():
+    from typing import Annotated
+
+    class AnnotatedCheck(DocumentTemplate):
+        weight: Annotated[int, {"unit": "kg"}]
+
+    test_obj = AnnotatedCheck(weight=70)
+    assert test_obj.weight == 70
+    with pytest.raises(TypeError):
+        test_obj.weight = "heavy"
+
+
 def test_cycling():
     # no self embedding if subdocument
     _check_cycling(CheckCycling)
@@ -150,6 +204,31 @@ def test_cycling():
 #     assert uk._id[: len("Country/")] == "Country/"
 
 
+def test_documentation(test_schema):
+    my_schema = test_schema
+    Person = my_schema.object.get("Person")
+    assert Person._to_dict()["@documentation"] == {
+        "@comment": "This is a person",
+        "@properties": {"name": "Name of the person.", "age": "Age of the person."},
+    }
+
+    class PropertyDoc(DocumentTemplate):
+        """Class with a Python property"""
+
+        name: str
+
+        @property
+        def computed(self):
+            """Computed prop doc"""
+            return self.name
+
+    # without an Attributes section, numpydoc documents the Python properties
+    assert PropertyDoc._to_dict()["@documentation"] == {
+        "@comment": "Class with a Python property",
+        "@properties": {"computed": "Computed prop doc"},
+    }
+
+
 def test_context(test_schema):
     my_schema = test_schema
     assert my_schema.to_dict()[0].get("@type") == "@context"
@@ -273,6 +352,21 @@ def test_add_enum_class():
     assert "MyEnum" in new_schema.object
 
 
+def test_mixin_enum_datatype():
+    class Mood(str, Enum):
+        happy = "happy"
+
+    class MoodCheck(DocumentTemplate):
+        mood: str
+        maybe_mood: Optional[str]
+
+    test_obj = MoodCheck(mood=Mood.happy, maybe_mood=Mood.happy)
+    test_dict = test_obj._obj_to_dict()[0]
+    assert test_dict["mood"] == str(Mood.happy)
+    assert test_dict["maybe_mood"] == str(Mood.happy)
+    assert not isinstance(test_dict["mood"], Enum)
+
+
 def test_empty_set():
     test_obj = CheckEmptySet()
     test_obj._obj_to_dict()[0]
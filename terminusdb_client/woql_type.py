@@ -13,6 +13,8 @@ CONVERT_TYPE = {
     dt.timedelta: "xsd:duration",
 }
 
+INVERT_TYPE = {v: k for k, v in CONVERT_TYPE.items()}
+
 
 def to_woql_type(input_type: type):
     if input_type in CONVERT_TYPE:
@@ -49,7 +51,6 @@ def from_woql_type(
     """
     if as_str:
         skip_convert_error = True
-    invert_type = {v: k for k, v in CONVERT_TYPE.items()}
     if isinstance(input_type, dict):
         if input_type["@type"] == "List":
             if as_str:
@@ -70,10 +71,10 @@ def from_woql_type(
             raise TypeError(
                 f"Input type {input_type} cannot be converted to Python type"
             )
-    elif input_type in invert_type:
+    elif input_type in INVERT_TYPE:
         if as_str:
-            return invert_type[input_type].__name__
-        return invert_type[input_type]
+            return INVERT_TYPE[input_type].__name__
+        return INVERT_TYPE[input_type]
     elif skip_convert_error:
         if as_str:
             return f"'{input_type}'"
@@ -34,7 +34,7 @@ def result_to_df(all_records, keepid=False, max_embed_dep=0, client=None):
                 if not keepid:
                     # expanded.rename(columns={"@id": "Document id"}, inplace=True)
                     expanded.drop(
-                        columns=list(filter(lambda x: x[0] == "@", expanded.columns)),
+                        columns=[x for x in expanded.columns if x[0] == "@"],
                         inplace=True,
                     )
                 expanded.columns = [col + "." + x for x in expanded]
@@ -78,7 +78,7 @@ def result_to_df(all_records, keepid=False, max_embed_dep=0, client=None):
         class_obj = all_types[0]
     if not keepid:
         df.rename(columns={"@id": "Document id"}, inplace=True)
-        df.drop(columns=list(filter(lambda x: x[0] == "@", df.columns)), inplace=True)
+        df.drop(columns=[x for x in df.columns if x[0] == "@"], inplace=True)
     df = expand_df(df)
     if max_embed_dep > 0:
         if class_obj not in all_existing_class: